@@ -7,7 +7,11 @@
 # All rights reserved.
 #
 
+import atexit
 import os
+import random
+import threading
+import time
 
 from sonic_platform_base.device_base import DeviceBase
 from sonic_platform_base.module_base import ModuleBase
@@ -15,6 +19,12 @@ import grpc
 from platform_ndk import platform_ndk_pb2
 from platform_ndk import platform_ndk_pb2_grpc
 
+# grpc.aio is only available with newer grpcio releases
+try:
+    from grpc import aio as grpc_aio
+except ImportError:
+    grpc_aio = None
+
 NOKIA_UNIX_SOCKET_PREFIX = "unix://"
 NOKIA_SONIC_UNIX_SOCKET_FOLDER = "/var/run/redis/"
 NOKIA_DEVMGR_SONIC_UNIX_SOCKET_NAME = "devmgr_sonic_server"
@@ -59,6 +69,33 @@ NOKIA_GRPC_UTIL_SERVICE = 'Util-Service'
 NOKIA_GRPC_EEPROM_SERVICE = 'Eeprom-Service'
 NOKIA_GRPC_MIDPLANE_SERVICE = 'Midplane-Service'
 
+# Keepalive pings detect a dead connection to the server between polling
+# bursts. They are only sent while calls are active and no more often than
+# the default server policy (5 min) allows, so the server does not answer
+# them with GOAWAY too_many_pings.
+NOKIA_GRPC_CHANNEL_OPTIONS = [
+    ('grpc.use_local_subchannel_pool', 1),
+    ('grpc.keepalive_time_ms', 300000),
+    ('grpc.keepalive_timeout_ms', 10000)
+]
+# Number of channels kept per service so that concurrent callers are not
+# serialized on the stream limit of a single HTTP/2 connection
+NOKIA_GRPC_CHANNEL_POOL_SIZE = 4
+# After failing to reach the server, channel_get_stub() gives up right away
+# for this long instead of waiting for the channels again on every call
+NOKIA_GRPC_CHANNEL_RETRY_SECS = 5
+NOKIA_GRPC_RPC_TIMEOUT_SECS = 2.0
+# Consecutive connectivity failures after which a pooled channel is replaced
+NOKIA_GRPC_CHANNEL_MAX_FAILURES = 3
+NOKIA_GRPC_CHANNEL_FAULT_CODES = (grpc.StatusCode.UNAVAILABLE,
+                                  grpc.StatusCode.DEADLINE_EXCEEDED)
+# A replaced channel may still carry RPCs of other callers, it is only
+# closed once it has been out of the pool for this long. A pool entry is
+# not replaced again within the same period.
+NOKIA_GRPC_CHANNEL_RETIRE_SECS = 60
+# Replaced channels kept open at most, no further replacement beyond that
+NOKIA_GRPC_CHANNEL_MAX_RETIRED = 2 * NOKIA_GRPC_CHANNEL_POOL_SIZE
+
 HW_SLOT_TO_EXTERNAL_SLOT_MAPPING = {
     0: "A",
     1: "1",
@@ -83,9 +120,21 @@ HW_SLOT_TO_EXTERNAL_SLOT_MAPPING = {
 
 
 my_chassis_type = platform_ndk_pb2.HwChassisType.HW_CHASSIS_TYPE_INVALID
+# Our own slot never changes, it is cached once known, see _get_my_slot()
+my_slot = NOKIA_INVALID_SLOT_NUMBER
 
+# Pools of long-lived channels, keyed by service name, see channel_get_stub()
+_channel_cache = {}
+_channel_cache_lock = threading.Lock()
+# Pool entry of every pooled stub, and replaced channels waiting to be closed
+_channel_stub_entries = {}
+_channel_retired = []
+# Per service lock serializing the pool setup, and time of last failed setup
+_channel_pool_locks = {}
+_channel_setup_failed = {}
 
-def channel_setup(service):
+
+def _get_server_path(service):
     if service == NOKIA_GRPC_MIDPLANE_SERVICE:
        server_path = NOKIA_MIDPLANE_ETHMGR_SOCKET_PATH
     else:
@@ -93,16 +142,11 @@ def channel_setup(service):
 
     if os.path.exists(NOKIA_CHANNEL_FILE_PATH):
         server_path = (open(NOKIA_CHANNEL_FILE_PATH, 'r').readline().rstrip())
-    _channel = grpc.insecure_channel(server_path)
-    _stub = None
+    return server_path
 
-    _channel_ready = grpc.channel_ready_future(_channel)
-    try:
-        _channel_ready.result(timeout=0.5)
-    except grpc.FutureTimeoutError:
-        _channel = None
-        return _channel, _stub
 
+def _get_service_stub(service, _channel):
+    _stub = None
     if service == NOKIA_GRPC_CHASSIS_SERVICE:
         _stub = platform_ndk_pb2_grpc.ChassisPlatformNdkServiceStub(_channel)
     elif service == NOKIA_GRPC_PSU_SERVICE:
@@ -123,6 +167,21 @@ def channel_setup(service):
         _stub = platform_ndk_pb2_grpc.EepromPlatformNdkServiceStub(_channel)
     elif service == NOKIA_GRPC_MIDPLANE_SERVICE:
         _stub = platform_ndk_pb2_grpc.MidplanePlatformNdkServiceStub(_channel)
+    return _stub
+
+
+def channel_setup(service):
+    _channel = grpc.insecure_channel(_get_server_path(service))
+    _stub = None
+
+    _channel_ready = grpc.channel_ready_future(_channel)
+    try:
+        _channel_ready.result(timeout=0.5)
+    except grpc.FutureTimeoutError:
+        _channel = None
+        return _channel, _stub
+
+    _stub = _get_service_stub(service, _channel)
 
     return _channel, _stub
 
@@ -131,17 +190,183 @@ def channel_shutdown(_channel):
     _channel.close()
 
 
+def channel_get_stub(service):
+    """
+    Returns a stub for the service over a long-lived channel. A pool of
+    channels is created on first use and reused by later callers instead of
+    doing a channel_setup/channel_shutdown around every RPC.
+    :param service: NOKIA_GRPC_*_SERVICE name
+    :return: stub, or None if the server is not reachable
+    """
+    if _channel_retired:
+        _channel_close_expired()
+
+    pool = _channel_cache.get(service)
+    if pool is None:
+        with _get_channel_pool_lock(service):
+            pool = _channel_cache.get(service)
+            if pool is None:
+                failed = _channel_setup_failed.get(service)
+                if failed is not None and time.monotonic() - failed < NOKIA_GRPC_CHANNEL_RETRY_SECS:
+                    return None
+
+                pool = _channel_pool_setup(service)
+                if not pool:
+                    _channel_setup_failed[service] = time.monotonic()
+                    return None
+                _channel_setup_failed.pop(service, None)
+                with _channel_cache_lock:
+                    _channel_cache[service] = pool
+
+    return pool[random.randrange(len(pool))].stub
+
+
+def _get_channel_pool_lock(service):
+    with _channel_cache_lock:
+        return _channel_pool_locks.setdefault(service, threading.Lock())
+
+
+class _PooledChannel(object):
+    def __init__(self, service, index):
+        self.service = service
+        self.index = index
+        # Distinct channel args keep grpc from sharing one connection
+        options = NOKIA_GRPC_CHANNEL_OPTIONS + [('grpc.channel_id', index)]
+        self.channel = grpc.insecure_channel(_get_server_path(service), options=options)
+        self.stub = _get_service_stub(service, self.channel)
+        self.failures = 0
+        self.replaced_at = None
+
+
+def _channel_pool_setup(service):
+    pool = [_PooledChannel(service, i) for i in range(NOKIA_GRPC_CHANNEL_POOL_SIZE)]
+
+    # Channels connect in parallel, wait for all of them at most once
+    ready_futures = [grpc.channel_ready_future(entry.channel) for entry in pool]
+    deadline = time.monotonic() + 0.5
+    for _channel_ready in ready_futures:
+        try:
+            _channel_ready.result(timeout=max(deadline - time.monotonic(), 0))
+        except grpc.FutureTimeoutError:
+            for entry in pool:
+                entry.channel.close()
+            return []
+
+    with _channel_cache_lock:
+        for entry in pool:
+            _channel_stub_entries[entry.stub] = entry
+    return pool
+
+
+def _channel_record_result(stub, code):
+    entry = _channel_stub_entries.get(stub)
+    if entry is None:
+        return
+
+    if code not in NOKIA_GRPC_CHANNEL_FAULT_CODES:
+        entry.failures = 0
+        return
+
+    with _get_channel_pool_lock(entry.service):
+        entry.failures += 1
+        if entry.failures < NOKIA_GRPC_CHANNEL_MAX_FAILURES or \
+                _channel_stub_entries.get(stub) is not entry:
+            return
+
+        now = time.monotonic()
+        if entry.replaced_at is not None and now - entry.replaced_at < NOKIA_GRPC_CHANNEL_RETIRE_SECS:
+            return
+        if len(_channel_retired) >= NOKIA_GRPC_CHANNEL_MAX_RETIRED:
+            return
+        # When the whole pool fails the server is down, and grpc reconnects
+        # by itself once it is back
+        pool = _channel_cache[entry.service]
+        if all(other.failures for other in pool if other is not entry):
+            return
+
+        # Replace only this channel, the rest of the pool is left alone
+        new_entry = _PooledChannel(entry.service, entry.index)
+        new_entry.replaced_at = now
+        with _channel_cache_lock:
+            _channel_cache[entry.service][entry.index] = new_entry
+            del _channel_stub_entries[stub]
+            _channel_stub_entries[new_entry.stub] = new_entry
+            _channel_retired.append((now, entry.channel))
+
+
+def _channel_close_expired():
+    now = time.monotonic()
+    with _channel_cache_lock:
+        expired = [c for t, c in _channel_retired if now - t >= NOKIA_GRPC_CHANNEL_RETIRE_SECS]
+        _channel_retired[:] = [(t, c) for t, c in _channel_retired
+                               if now - t < NOKIA_GRPC_CHANNEL_RETIRE_SECS]
+
+    for _channel in expired:
+        _channel.close()
+
+
+def channel_try_grpc(stub, callback, *args, **kwargs):
+    """
+    try_grpc() for RPCs over a stub from channel_get_stub(). A pooled
+    channel failing with NOKIA_GRPC_CHANNEL_FAULT_CODES
+    NOKIA_GRPC_CHANNEL_MAX_FAILURES times in a row is replaced, so that
+    later channel_get_stub() calls do not hand it out again.
+    :param stub: Stub the callback belongs to
+    :param callback: Callback to be invoked
+    :param args: Arguments to be passed to callback
+    :param kwargs: Keyword arguments to be passed to callback, e.g. timeout
+    :return: Same as try_grpc()
+    """
+    def _callback(*args, **kwargs):
+        try:
+            resp = callback(*args, **kwargs)
+        except grpc.RpcError as e:
+            _channel_record_result(stub, e.code())
+            raise
+        _channel_record_result(stub, grpc.StatusCode.OK)
+        return resp
+
+    return try_grpc(_callback, *args, **kwargs)
+
+
+def aio_channel_setup(service):
+    """
+    Creates a grpc.aio channel and stub for the service. It has to be
+    called from the event loop the channel will be used on.
+    :param service: NOKIA_GRPC_*_SERVICE name
+    :return: channel, stub
+    """
+    _channel = grpc_aio.insecure_channel(_get_server_path(service),
+                                         options=NOKIA_GRPC_CHANNEL_OPTIONS)
+    return _channel, _get_service_stub(service, _channel)
+
+
+def _channel_cache_shutdown():
+    with _channel_cache_lock:
+        for pool in _channel_cache.values():
+            for entry in pool:
+                entry.channel.close()
+        for _timestamp, _channel in _channel_retired:
+            _channel.close()
+        _channel_cache.clear()
+        _channel_stub_entries.clear()
+        del _channel_retired[:]
+
+
+atexit.register(_channel_cache_shutdown)
+
+
 def try_grpc(callback, *args, **kwargs):
     """
     Handy function to invoke the callback and catch NotImplementedError
     :param callback: Callback to be invoked
     :param args: Arguments to be passed to callback
-    :param kwargs: Default return value if exception occur
+    :param kwargs: Keyword arguments to be passed to callback, e.g. timeout
     :return: Default return value if exception occur else return value of the callback
     """
     return_val = True
     try:
-        resp = callback(*args)
+        resp = callback(*args, **kwargs)
         if resp is None:
             resp_status = platform_ndk_pb2.ResponseStatus(error_msg='No response available')
             resp = platform_ndk_pb2.DefaultResponse(response_status=resp_status)
@@ -158,16 +383,7 @@ def try_grpc(callback, *args, **kwargs):
 
 
 def is_cpm():
-    channel, stub = channel_setup(NOKIA_GRPC_CHASSIS_SERVICE)
-    if not channel or not stub:
-        return False
-    ret, response = try_grpc(stub.GetMySlot, platform_ndk_pb2.ReqModuleInfoPb())
-    channel_shutdown(channel)
-
-    if ret is False:
-        return False
-
-    return (response.my_slot == NOKIA_CPM_SLOT_NUMBER)
+    return (_get_my_slot() == NOKIA_CPM_SLOT_NUMBER)
 
 
 def _get_cpm_slot():
@@ -175,6 +391,10 @@ def _get_cpm_slot():
 
 
 def _get_my_slot():
+    global my_slot
+    if my_slot != NOKIA_INVALID_SLOT_NUMBER:
+        return my_slot
+
     channel, stub = channel_setup(NOKIA_GRPC_CHASSIS_SERVICE)
     if not channel or not stub:
         return NOKIA_INVALID_SLOT_NUMBER
@@ -184,7 +404,8 @@ def _get_my_slot():
     if ret is False:
         return NOKIA_INVALID_SLOT_NUMBER
 
-    return response.my_slot
+    my_slot = response.my_slot
+    return my_slot
 
 def hw_slot_to_external_slot(slot):
     if slot in HW_SLOT_TO_EXTERNAL_SLOT_MAPPING:
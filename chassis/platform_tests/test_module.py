@@ -14,11 +14,19 @@ import random
 try:
     from sonic_platform_base.module_base import ModuleBase
     from sonic_platform.platform import Platform
+    from platform_ndk import nokia_common
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found")
 
 chassis = Platform().get_chassis()
 
+MODULE_STATUSES = [ModuleBase.MODULE_STATUS_EMPTY,
+                   ModuleBase.MODULE_STATUS_OFFLINE,
+                   ModuleBase.MODULE_STATUS_POWERED_DOWN,
+                   ModuleBase.MODULE_STATUS_PRESENT,
+                   ModuleBase.MODULE_STATUS_FAULT,
+                   ModuleBase.MODULE_STATUS_ONLINE]
+
 
 def _get_index(module):
     return str(module.module_index)
@@ -111,3 +119,27 @@ def test_module_sanity():
         assert module.is_replaceable() is True
         assert module.get_position_in_parent() != -1
         assert module.set_admin_state(True) is False
+
+
+def test_module_update_all_oper_status():
+    chassis.update_all_modules_oper_status()
+    for module in chassis.get_all_modules():
+        assert module.get_oper_status() in MODULE_STATUSES
+
+
+def test_module_refresh_all():
+    assert chassis.refresh_all_modules() is True
+    for module in chassis.get_all_modules():
+        oper_status = module.get_oper_status()
+        assert oper_status in MODULE_STATUSES
+        if oper_status == ModuleBase.MODULE_STATUS_EMPTY:
+            continue
+        assert module.get_description() != 'Unavailable'
+
+        if oper_status != ModuleBase.MODULE_STATUS_ONLINE:
+            continue
+        if module.get_type() == ModuleBase.MODULE_TYPE_FABRIC:
+            continue
+        if module.get_slot() == chassis.get_my_slot():
+            continue
+        assert module.get_midplane_ip() != nokia_common.NOKIA_INVALID_IP
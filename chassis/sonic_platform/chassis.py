@@ -351,6 +351,24 @@ class Chassis(ChassisBase):
         """
         return (self._get_module_list())
 
+    def update_all_modules_oper_status(self):
+        """
+        Refreshes the operational status of all modules, keeping the
+        status RPCs of all modules in flight at the same time
+        """
+        Module.refresh_all_oper_status(self.get_all_modules())
+
+    def refresh_all_modules(self):
+        """
+        Refreshes the status, description and midplane info of all modules,
+        keeping the RPCs of all modules in flight at the same time
+
+        Returns:
+            bool: True if the status of at least one module has been
+            refreshed, False if not
+        """
+        return Module.refresh_all(self.get_all_modules())
+
     def get_module(self, index):
         self._get_module_list()
         return super(Chassis, self).get_module(index)
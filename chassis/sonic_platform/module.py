@@ -7,6 +7,11 @@
 # All rights reserved.
 #
 
+import asyncio
+import atexit
+import threading
+import time
+
 try:
     from sonic_platform_base.module_base import ModuleBase
     from platform_ndk import nokia_common
@@ -26,10 +31,127 @@ DESCRIPTION_MAPPING = {
     "cpm4-ixr": "Nokia-IXR7250E-SUP-10"
 }
 
+HW_MODULE_TYPE_CONTROL = platform_ndk_pb2.HwModuleType.HW_MODULE_TYPE_CONTROL
+HW_CHASSIS_TYPE_IXR6 = platform_ndk_pb2.HwChassisType.HW_CHASSIS_TYPE_IXR6
+HW_CHASSIS_TYPE_INVALID = platform_ndk_pb2.HwChassisType.HW_CHASSIS_TYPE_INVALID
+
+MODULE_TYPE_MAPPING = {
+    ModuleBase.MODULE_TYPE_SUPERVISOR: HW_MODULE_TYPE_CONTROL,
+    ModuleBase.MODULE_TYPE_LINE: platform_ndk_pb2.HwModuleType.HW_MODULE_TYPE_LINE,
+    ModuleBase.MODULE_TYPE_FABRIC: platform_ndk_pb2.HwModuleType.HW_MODULE_TYPE_FABRIC
+}
+
+# Getters answer from the snapshot taken by Module.refresh_all() while it
+# is younger than this
+MODULE_INFO_SNAPSHOT_TTL_SECS = 0.5
+# A slot last seen empty is not queried again for this long
+MODULE_EMPTY_STATUS_TTL_SECS = 5
+# Presence and power lookups reuse a known oper status for this long
+MODULE_STATUS_CACHE_TTL_SECS = 5
+# Midplane IPs only change when a card is replaced, re-read them this often
+MODULE_MIDPLANE_IP_TTL_SECS = 60
+
+
+def _build_control_description_table(chassis_type):
+    # Supervisor descriptions depend on the chassis rather than the card
+    if chassis_type == HW_CHASSIS_TYPE_IXR6:
+        description = "Nokia-IXR7250-SUP-6"
+    else:
+        description = "Nokia-IXR7250-SUP-10"
+    return {name: description for name in DESCRIPTION_MAPPING}
+
+
+def _try_grpc(stub, callback, *args):
+    return nokia_common.channel_try_grpc(stub, callback, *args,
+                                         timeout=nokia_common.NOKIA_GRPC_RPC_TIMEOUT_SECS)
+
+
+def _try_grpc_result(stub, future):
+    # The deadline was already set when the RPC was issued
+    return nokia_common.channel_try_grpc(stub, future.result)
+
+
+class _AsyncStatusPoller(object):
+    """
+    Event loop running in a background thread, used to keep the status
+    RPCs of all modules in flight over a single grpc.aio channel
+    """
+
+    def __init__(self):
+        self._channel = None
+        self._stub = None
+        self._poll_lock = None
+        self._failures = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name='module-status-poller', daemon=True)
+        self._thread.start()
+
+    def poll(self, modules):
+        future = asyncio.run_coroutine_threadsafe(self._poll(modules), self._loop)
+        return future.result()
+
+    def shutdown(self):
+        future = asyncio.run_coroutine_threadsafe(self._close(), self._loop)
+        try:
+            future.result(timeout=nokia_common.NOKIA_GRPC_RPC_TIMEOUT_SECS)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _poll(self, modules):
+        # Polls run one at a time, so the channel can be closed in between
+        if self._poll_lock is None:
+            self._poll_lock = asyncio.Lock()
+        async with self._poll_lock:
+            # The aio channel must be created on the loop it is used from
+            if self._stub is None:
+                self._channel, self._stub = nokia_common.aio_channel_setup(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+            results = await asyncio.gather(*(module._aupdate_oper_status(self._stub) for module in modules),
+                                           return_exceptions=True)
+
+            faults = 0
+            for result in results:
+                if not isinstance(result, Exception):
+                    continue
+                if not isinstance(result, nokia_common.grpc_aio.AioRpcError):
+                    raise result
+                if result.code() in nokia_common.NOKIA_GRPC_CHANNEL_FAULT_CODES:
+                    faults += 1
+
+            # Rebuild the channel after repeated polls with connectivity failures
+            self._failures = self._failures + 1 if faults else 0
+            if self._failures >= nokia_common.NOKIA_GRPC_CHANNEL_MAX_FAILURES:
+                self._failures = 0
+                await self._close()
+
+    async def _close(self):
+        if self._channel is not None:
+            channel = self._channel
+            self._channel = None
+            self._stub = None
+            await channel.close()
+
+
+_async_status_poller = None
+_async_status_poller_lock = threading.Lock()
+
+
+def _get_async_status_poller():
+    global _async_status_poller
+    with _async_status_poller_lock:
+        if _async_status_poller is None:
+            _async_status_poller = _AsyncStatusPoller()
+            atexit.register(_async_status_poller.shutdown)
+    return _async_status_poller
+
 
 class Module(ModuleBase):
     """Nokia IXR-7250 Platform-specific Module class"""
 
+    _control_description_table = None
+    _eeprom_lock = threading.Lock()
+
     def __init__(self, module_index, module_name, module_type, module_slot, stub):
         super(Module, self).__init__()
         self.module_index = module_index
@@ -38,11 +160,23 @@ class Module(ModuleBase):
         self.hw_slot = module_slot
         self.chassis_stub = stub
         self.oper_status = ModuleBase.MODULE_STATUS_EMPTY
-        self.midplane_status = nokia_common.NOKIA_INVALID_IP
+        self.midplane_ip = nokia_common.NOKIA_INVALID_IP
         self.max_consumed_power = 0.0
-        self.eeprom = None
-        if nokia_common._get_my_slot() == module_slot:
-            self.eeprom = Eeprom()
+        self._description = None
+        self._external_slot = nokia_common.hw_slot_to_external_slot(module_slot)
+        self._midplane_reachable = False
+        self._info_timestamp = None
+        self._status_timestamp = None
+        self._midplane_ip_timestamp = None
+        # Request messages never change for a given module, build them once
+        self._info_req = platform_ndk_pb2.ReqModuleInfoPb(module_type=self.get_platform_type(),
+                                                          hw_slot=module_slot)
+        self._slot_req = platform_ndk_pb2.ReqModuleInfoPb(hw_slot=module_slot)
+        self._reboot_reqs = {}
+        self._asic_list = None
+        # Only the module we run on has an eeprom, see _get_eeprom()
+        self._eeprom = None
+        self._eeprom_probed = False
 
     def get_name(self):
         """
@@ -54,10 +188,7 @@ class Module(ModuleBase):
         return self.module_name
 
     def get_presence(self):
-        if self.get_oper_status() == ModuleBase.MODULE_STATUS_EMPTY:
-            return False
-        else:
-            return True
+        return self._get_cached_oper_status() != ModuleBase.MODULE_STATUS_EMPTY
 
     def get_status(self):
         if self.get_oper_status() == ModuleBase.MODULE_STATUS_ONLINE:
@@ -72,27 +203,41 @@ class Module(ModuleBase):
         Returns:
             string: The description of the module
         """
-        channel, stub = nokia_common.channel_setup(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
-        if not channel or not stub:
+        if self._is_known_empty():
+            return 'Unavailable'
+        # The description only changes when a card is inserted in the slot
+        if self._description is not None:
+            return self._description
+
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
             return 'Unavailable'
-        platform_module_type = self.get_platform_type()
-        ret, response = nokia_common.try_grpc(
-            stub.GetModuleName,
-            platform_ndk_pb2.ReqModuleInfoPb(module_type=platform_module_type, hw_slot=self._get_hw_slot()))
-        nokia_common.channel_shutdown(channel)
+        ret, response = _try_grpc(stub, stub.GetModuleName, self._info_req)
 
         if ret is False:
             return 'Unavailable'
 
-        description = response.name
-        if response.name in DESCRIPTION_MAPPING:
-            description = DESCRIPTION_MAPPING[response.name]
-            if platform_module_type == platform_ndk_pb2.HwModuleType.HW_MODULE_TYPE_CONTROL:
-                if nokia_common.get_chassis_type() == platform_ndk_pb2.HwChassisType.HW_CHASSIS_TYPE_IXR6:
-                    description = "Nokia-IXR7250-SUP-6"
-                else:
-                    description = "Nokia-IXR7250-SUP-10"
-        return description
+        return self._set_description(response.name)
+
+    def _set_description(self, name):
+        if self.get_platform_type() == HW_MODULE_TYPE_CONTROL:
+            description_table = self._get_control_description_table()
+        else:
+            description_table = DESCRIPTION_MAPPING
+        self._description = description_table.get(name, name)
+        return self._description
+
+    @classmethod
+    def _get_control_description_table(cls):
+        if cls._control_description_table is not None:
+            return cls._control_description_table
+
+        chassis_type = nokia_common.get_chassis_type()
+        description_table = _build_control_description_table(chassis_type)
+        # Keep asking until the chassis type is known
+        if chassis_type != HW_CHASSIS_TYPE_INVALID:
+            cls._control_description_table = description_table
+        return description_table
 
     def _get_hw_slot(self):
         """
@@ -110,7 +255,7 @@ class Module(ModuleBase):
         Returns:
             int: slot representation, usually number
         """
-        return nokia_common.hw_slot_to_external_slot(self.hw_slot)
+        return self._external_slot
 
     def get_type(self):
         """
@@ -128,21 +273,84 @@ class Module(ModuleBase):
         Returns:
             string: The status-string of the module
         """
-        channel, stub = nokia_common.channel_setup(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
-        if not channel or not stub:
+        if self._is_status_fresh() or self._is_known_empty():
             return self.oper_status
-        platform_module_type = self.get_platform_type()
-        ret, response = nokia_common.try_grpc(
-            stub.GetModuleStatus,
-            platform_ndk_pb2.ReqModuleInfoPb(module_type=platform_module_type, hw_slot=self._get_hw_slot()))
-        nokia_common.channel_shutdown(channel)
+
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
+            return self.oper_status
+        ret, response = _try_grpc(stub, stub.GetModuleStatus, self._info_req)
 
         if ret is False:
             return self.oper_status
 
-        self.oper_status = nokia_common.hw_module_status_name(response.status)
+        return self._set_oper_status(nokia_common.hw_module_status_name(response.status))
+
+    def _set_oper_status(self, oper_status):
+        # No status was read yet, so there is no transition to react to
+        if self._status_timestamp is not None:
+            # The description and midplane IP are only valid while the same
+            # card stays in the slot
+            if (self.oper_status == ModuleBase.MODULE_STATUS_EMPTY) != \
+                    (oper_status == ModuleBase.MODULE_STATUS_EMPTY):
+                self._description = None
+                self._midplane_ip_timestamp = None
+        self.oper_status = oper_status
+        self._status_timestamp = time.monotonic()
         return self.oper_status
 
+    def _is_status_fresh(self):
+        return self._status_timestamp is not None and \
+            time.monotonic() - self._status_timestamp < MODULE_INFO_SNAPSHOT_TTL_SECS
+
+    def _get_cached_oper_status(self):
+        # Callers needing an up-to-date status use get_oper_status()
+        if self._status_timestamp is not None and \
+                time.monotonic() - self._status_timestamp < MODULE_STATUS_CACHE_TTL_SECS:
+            return self.oper_status
+        return self.get_oper_status()
+
+    def _is_known_empty(self):
+        return self.oper_status == ModuleBase.MODULE_STATUS_EMPTY and \
+            self._status_timestamp is not None and \
+            time.monotonic() - self._status_timestamp < MODULE_EMPTY_STATUS_TTL_SECS
+
+    def get_oper_status_future(self):
+        """
+        Issues the module-status RPC without waiting for the response, so
+        that the status of several modules can be in flight at once
+
+        Returns:
+            tuple of the stub and grpc.Future, to be passed to
+            update_oper_status(), or None
+        """
+        if self._is_known_empty():
+            return None
+
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
+            return None
+        return stub, stub.GetModuleStatus.future(self._info_req,
+                                                 timeout=nokia_common.NOKIA_GRPC_RPC_TIMEOUT_SECS)
+
+    def update_oper_status(self, pending):
+        """
+        Waits for the RPC returned by get_oper_status_future() and updates
+        the operational status of the module from its response
+
+        Returns:
+            string: The status-string of the module
+        """
+        if pending is None:
+            return self.oper_status
+        stub, future = pending
+        ret, response = _try_grpc_result(stub, future)
+
+        if ret is False:
+            return self.oper_status
+
+        return self._set_oper_status(nokia_common.hw_module_status_name(response.status))
+
     def get_position_in_parent(self):
         """
         Retrieves 1-based relative physical position in parent device.
@@ -169,23 +377,22 @@ class Module(ModuleBase):
         """
         # For fabric modules, return False. Reboot requires syncd etc needs to
         # be stopped first for clean bringup.
-        if self.get_type() == self.MODULE_TYPE_FABRIC:
+        if self.module_type == self.MODULE_TYPE_FABRIC:
             return False
 
         # Allow only reboot of self
-        if nokia_common._get_my_slot() != self._get_hw_slot():
+        if nokia_common._get_my_slot() != self.hw_slot:
             return False
 
-        channel, stub = nokia_common.channel_setup(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
-        if not channel or not stub:
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
             return False
 
-        platform_module_type = self.get_platform_type()
-        ret, response = nokia_common.try_grpc(
-            stub.RebootSlot,
-            platform_ndk_pb2.ReqModuleInfoPb(module_type=platform_module_type, hw_slot=self._get_hw_slot(),
-                                             reboot_type=reboot_type))
-        nokia_common.channel_shutdown(channel)
+        if reboot_type not in self._reboot_reqs:
+            self._reboot_reqs[reboot_type] = platform_ndk_pb2.ReqModuleInfoPb(
+                module_type=self.get_platform_type(), hw_slot=self.hw_slot, reboot_type=reboot_type)
+        # No deadline, the reboot request may take a while to be answered
+        ret, response = nokia_common.channel_try_grpc(stub, stub.RebootSlot, self._reboot_reqs[reboot_type])
 
         if ret is False:
             return False
@@ -211,14 +418,7 @@ class Module(ModuleBase):
         Returns:
             string: card-type
         """
-        if self.get_type() == self.MODULE_TYPE_SUPERVISOR:
-            return platform_ndk_pb2.HwModuleType.HW_MODULE_TYPE_CONTROL
-        elif self.get_type() == self.MODULE_TYPE_LINE:
-            return platform_ndk_pb2.HwModuleType.HW_MODULE_TYPE_LINE
-        elif self.get_type() == self.MODULE_TYPE_FABRIC:
-            return platform_ndk_pb2.HwModuleType.HW_MODULE_TYPE_FABRIC
-        else:
-            return 'Unknown card-type'
+        return MODULE_TYPE_MAPPING.get(self.module_type, 'Unknown card-type')
 
     def set_maximum_consumed_power(self, consumed_power):
         """
@@ -237,7 +437,7 @@ class Module(ModuleBase):
             A float, with value of the maximum consumable power of the
             module.
         """
-        if self.get_oper_status() == ModuleBase.MODULE_STATUS_EMPTY:
+        if self._get_cached_oper_status() == ModuleBase.MODULE_STATUS_EMPTY:
             return 0.0
         return self.max_consumed_power
 
@@ -245,71 +445,215 @@ class Module(ModuleBase):
         """
         Retrieves the midplane IP-address of the module in a modular chassis
         """
-        channel, stub = nokia_common.channel_setup(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
-        if not channel or not stub:
+        if self._is_known_empty():
+            return nokia_common.NOKIA_INVALID_IP
+        if self._is_info_fresh() or self._is_midplane_ip_fresh():
+            return self.midplane_ip
+
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
             return self.midplane_ip
-        ret, response = nokia_common.try_grpc(stub.GetMidplaneIP,
-                                              platform_ndk_pb2.ReqModuleInfoPb(hw_slot=self._get_hw_slot()))
-        nokia_common.channel_shutdown(channel)
+        ret, response = _try_grpc(stub, stub.GetMidplaneIP, self._slot_req)
 
         if ret is False:
             return self.midplane_ip
 
-        self.midplane_ip = response.midplane_ip
-        return response.midplane_ip
+        return self._set_midplane_ip(response.midplane_ip)
+
+    def _set_midplane_ip(self, midplane_ip):
+        self.midplane_ip = midplane_ip
+        if midplane_ip != nokia_common.NOKIA_INVALID_IP:
+            self._midplane_ip_timestamp = time.monotonic()
+        else:
+            self._midplane_ip_timestamp = None
+        return self.midplane_ip
+
+    def _is_midplane_ip_fresh(self):
+        return self._midplane_ip_timestamp is not None and \
+            time.monotonic() - self._midplane_ip_timestamp < MODULE_MIDPLANE_IP_TTL_SECS
 
     def is_midplane_reachable(self):
-        channel, stub = nokia_common.channel_setup(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
-        if not channel or not stub:
+        if self._is_info_fresh():
+            return self._midplane_reachable
+        if self._is_known_empty():
+            return False
+
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
             return False
-        ret, response = nokia_common.try_grpc(stub.IsMidplaneReachable,
-                                              platform_ndk_pb2.ReqModuleInfoPb(hw_slot=self._get_hw_slot()))
-        nokia_common.channel_shutdown(channel)
+        ret, response = _try_grpc(stub, stub.IsMidplaneReachable, self._slot_req)
 
         if ret is False:
             return False
+        self._midplane_reachable = response.midplane_status
         return response.midplane_status
 
+    @classmethod
+    def refresh_all(cls, modules):
+        """
+        Takes a snapshot of the status, description and midplane info of
+        all modules. The RPCs of all modules are issued before any response
+        is waited for, and the getters answer from the snapshot while it is
+        fresh.
+
+        Returns:
+            bool: True if the status of at least one module has been
+            refreshed, False if not
+        """
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
+            return False
+
+        pending = [(module, module._get_info_futures(stub)) for module in modules]
+        refreshed = False
+        for module, futures in pending:
+            if module._update_info(stub, futures):
+                refreshed = True
+        return refreshed
+
+    @classmethod
+    def refresh_all_oper_status(cls, modules):
+        """
+        Refreshes the operational status of all modules with their status
+        RPCs in flight at the same time, then get_oper_status() answers from
+        the result while it is fresh. Uses grpc.aio when it is available and
+        grpc futures otherwise.
+        """
+        if nokia_common.grpc_aio is not None:
+            _get_async_status_poller().poll(modules)
+            return
+
+        pending = [module.get_oper_status_future() for module in modules]
+        for module, status_pending in zip(modules, pending):
+            module.update_oper_status(status_pending)
+
+    async def aget_oper_status(self, stub):
+        """
+        Retrieves the operational status of the module over a grpc.aio stub
+
+        Returns:
+            string: The status-string of the module
+        """
+        try:
+            return await self._aupdate_oper_status(stub)
+        except nokia_common.grpc_aio.AioRpcError:
+            return self.oper_status
+
+    async def _aupdate_oper_status(self, stub):
+        if self._is_known_empty():
+            return self.oper_status
+        response = await stub.GetModuleStatus(self._info_req,
+                                              timeout=nokia_common.NOKIA_GRPC_RPC_TIMEOUT_SECS)
+        return self._set_oper_status(nokia_common.hw_module_status_name(response.status))
+
+    def _is_info_fresh(self):
+        return self._info_timestamp is not None and \
+            time.monotonic() - self._info_timestamp < MODULE_INFO_SNAPSHOT_TTL_SECS
+
+    def _get_info_futures(self, stub):
+        # Nothing to ask about a slot that was just seen empty
+        if self._is_known_empty():
+            return None
+
+        timeout = nokia_common.NOKIA_GRPC_RPC_TIMEOUT_SECS
+        futures = {
+            'status': stub.GetModuleStatus.future(self._info_req, timeout=timeout),
+            'midplane_ip': stub.GetMidplaneIP.future(self._slot_req, timeout=timeout),
+            'midplane_reachable': stub.IsMidplaneReachable.future(self._slot_req, timeout=timeout)
+        }
+        if self._description is None:
+            futures['name'] = stub.GetModuleName.future(self._info_req, timeout=timeout)
+        return futures
+
+    def _update_info(self, stub, futures):
+        if futures is None:
+            return False
+
+        ret, response = _try_grpc_result(stub, futures['status'])
+        status_ok = ret is not False
+        fresh = status_ok
+        if status_ok:
+            self._set_oper_status(nokia_common.hw_module_status_name(response.status))
+
+        if 'name' in futures:
+            ret, response = _try_grpc_result(stub, futures['name'])
+            if ret is not False:
+                self._set_description(response.name)
+
+        ret, response = _try_grpc_result(stub, futures['midplane_ip'])
+        if ret is False:
+            fresh = False
+        else:
+            self._set_midplane_ip(response.midplane_ip)
+
+        ret, response = _try_grpc_result(stub, futures['midplane_reachable'])
+        if ret is False:
+            fresh = False
+        else:
+            self._midplane_reachable = response.midplane_status
+
+        self._info_timestamp = time.monotonic() if fresh else None
+        return status_ok
+
+    def _get_eeprom(self):
+        if self._eeprom_probed:
+            return self._eeprom
+
+        with Module._eeprom_lock:
+            if not self._eeprom_probed:
+                my_slot = nokia_common._get_my_slot()
+                if my_slot == self.hw_slot:
+                    self._eeprom = Eeprom()
+                # Try again later if our own slot is not known yet
+                self._eeprom_probed = my_slot != nokia_common.NOKIA_INVALID_SLOT_NUMBER
+        return self._eeprom
+
     def get_model(self):
-        if self.eeprom is not None:
-            return self.eeprom.get_part_number()
+        eeprom = self._get_eeprom()
+        if eeprom is not None:
+            return eeprom.get_part_number()
         return None
 
     def get_serial(self):
-        if self.eeprom is not None:
-            return self.eeprom.get_serial_number()
+        eeprom = self._get_eeprom()
+        if eeprom is not None:
+            return eeprom.get_serial_number()
         return None
 
     def get_base_mac(self):
-        if self.eeprom is not None:
-            return self.eeprom.get_base_mac()
+        eeprom = self._get_eeprom()
+        if eeprom is not None:
+            return eeprom.get_base_mac()
         return None
 
     def get_system_eeprom_info(self):
-        if self.eeprom is not None:
-            return self.eeprom.get_system_eeprom_info()
+        eeprom = self._get_eeprom()
+        if eeprom is not None:
+            return eeprom.get_system_eeprom_info()
         return None
 
     def get_all_asics(self):
+        # PCIe topology does not change at runtime, fetch it only once
+        if self._asic_list is not None:
+            return self._asic_list
+
+        if self.module_type != ModuleBase.MODULE_TYPE_FABRIC:
+            self._asic_list = []
+            return self._asic_list
+
         asic_list = []
-        if self.get_name().startswith(ModuleBase.MODULE_TYPE_FABRIC):
-            channel, stub = nokia_common.channel_setup(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
-            if not channel or not stub:
-                return asic_list
-            ret, response = nokia_common.try_grpc(stub.GetFabricPcieInfo,
-                                                  platform_ndk_pb2.ReqModuleInfoPb(hw_slot=self._get_hw_slot()))
-            nokia_common.channel_shutdown(channel)
-
-            if ret is False:
-                return asic_list
-
-            if response.response_status.status_code == platform_ndk_pb2.ResponseCode.NDK_ERR_RESOURCE_NOT_FOUND:
-                return asic_list
-
-            i = 0
-            while i < len(response.pcie_info.asic_entry):
-                asic_info = response.pcie_info.asic_entry[i]
-                asic_list.append((str(asic_info.asic_idx), str(asic_info.asic_pcie_id)))
-                i += 1
-
-        return asic_list
+        stub = nokia_common.channel_get_stub(nokia_common.NOKIA_GRPC_CHASSIS_SERVICE)
+        if not stub:
+            return asic_list
+        ret, response = _try_grpc(stub, stub.GetFabricPcieInfo, self._slot_req)
+
+        if ret is False:
+            return asic_list
+
+        if response.response_status.status_code == platform_ndk_pb2.ResponseCode.NDK_ERR_RESOURCE_NOT_FOUND:
+            return asic_list
+
+        asic_entry = response.pcie_info.asic_entry
+        self._asic_list = [(str(asic_info.asic_idx), str(asic_info.asic_pcie_id))
+                           for asic_info in asic_entry]
+        return self._asic_list